@@ -1,26 +1,33 @@
 import os
+from functools import lru_cache
 
-from flask import Flask, app, render_template, redirect, url_for
-from werkzeug.security import generate_password_hash
+from flask import Flask, redirect, url_for
 from dotenv import load_dotenv
 
-from app.conversores.full_convert import full_convert_bp
 
+if not os.environ.get('SECRET_KEY') and not os.environ.get('DISABLE_DOTENV'):
+    load_dotenv()
 
-load_dotenv()
+_SECRET_KEY = os.getenv('SECRET_KEY', '')
 
+@lru_cache(maxsize=1)
 def create_app():
     app = Flask(__name__,static_folder="static", template_folder="templates")
 
-    app.secret_key = os.getenv('SECRET_KEY', '')
+    app.secret_key = _SECRET_KEY
 
     registry_routes(app)
 
     return app
 
 def registry_routes(app):
+    from app.conversores.full_convert import full_convert_bp
+
     app.register_blueprint(full_convert_bp, url_prefix='/full_convert')
-    
+
+    with app.test_request_context():
+        home_target = url_for('full_convert.index')
+
     @app.route('/')
     def home():
-        return redirect(url_for('full_convert.index'))
+        return redirect(home_target, code=308)
@@ -1,24 +1,221 @@
+import gzip
+import hashlib
 import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Optional
-from flask import Blueprint, render_template, request, jsonify
+from flask import Blueprint, Response, current_app, render_template, request, jsonify
+from werkzeug.exceptions import RequestEntityTooLarge
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 full_convert_bp = Blueprint('full_convert', __name__)
 
+MAX_INPUT_CHARS = 512 * 1024
+MAX_REQUEST_BYTES = 1024 * 1024
+GZIP_MIN_BYTES = 4 * 1024
+
+_PACKAGE_RE = re.compile(r'package\s+([\w\.]+);')
+_CLASS_RE = re.compile(r'public\s+class\s+(\w+)\s+extends\s+ModelBase')
+_TEXTURE_WIDTH_RE = re.compile(r'this\.textureWidth\s*=\s*(\d+)')
+_TEXTURE_HEIGHT_RE = re.compile(r'this\.textureHeight\s*=\s*(\d+)')
+
+_PART_DECLARATION_RES = [
+    re.compile(r'ModelRenderer\s+(\w+);'),
+    re.compile(r'private\s+ModelRenderer\s+(\w+);'),
+    re.compile(r'public\s+ModelRenderer\s+(\w+);'),
+    re.compile(r'protected\s+ModelRenderer\s+(\w+);'),
+    re.compile(r'ModelRenderer\s+(\w+)\s*='),
+    re.compile(r'this\.(\w+)\s*=\s*new\s+ModelRenderer'),
+    re.compile(r'(\w+)\s*=\s*new\s+ModelRenderer\('),
+    re.compile(r'private\s+final\s+ModelRenderer\s+(\w+);'),
+    re.compile(r'public\s+final\s+ModelRenderer\s+(\w+);')
+]
+
+_PART_STATEMENT_RE = re.compile(
+    r'(?<![\w.])(?:this\.)?(?P<name>\w+)\.'
+    r'(?:addBox\((?P<addbox>[^)]+)\)|setRotationPoint\((?P<rotation>[^)]+)\)|mirror\s*=\s*(?P<mirror>true|false))'
+    r'|setRotationPoint\(\s*(?:this\.)?(?P<rotation_name>\w+)\s*,\s*(?P<rotation_args>[^)]+)\)'
+    r'|setRotation\(\s*(?:\(\w+\)\s*)?(?:this\.)?(?P<set_rotation_name>\w+)\s*,\s*(?P<set_rotation>[^)]+)\)'
+)
+
+_PART_SITE_RE = re.compile(r'(?:(this\.)|(?<![\w.]))(\w+)\s*=\s*new\s+ModelRenderer')
+
+_PART_BLOCK_TEMPLATES = (
+    (r'(this\.{name}\s*=\s*new\s+ModelRenderer[^;]+;[\s\S]*?)(?=this\.\w+\s*=\s*new\s+ModelRenderer|private\s+|public\s+|protected\s+|$)', re.MULTILINE),
+    (r'({name}\s*=\s*new\s+ModelRenderer[^;]+;[\s\S]*?)(?=\w+\s*=\s*new\s+ModelRenderer|private\s+|public\s+|protected\s+|$)', re.MULTILINE)
+)
+_PART_ALT_ROTATION_TEMPLATES = (
+    (r'{name}[^=]*=\s*new\s+ModelRenderer[^;]+;\s*\n[^;]*setRotationPoint\(([^)]+)\)', re.DOTALL),
+    (r'new\s+ModelRenderer[^;]+;\s*{name}\.setRotationPoint\(([^)]+)\)', re.DOTALL)
+)
+
+_TEXTURE_OFFSET_RES = [
+    re.compile(r'new\s+ModelRenderer\([^,]*,\s*(\d+),\s*(\d+)\)'),
+    re.compile(r'setTextureOffset\((\d+),\s*(\d+)\)'),
+    re.compile(r'setTextureSize\((\d+),\s*(\d+)\)')
+]
+_ADDBOX_RES = [
+    re.compile(r'addBox\(([^)]+)\)'),
+    re.compile(r'func_78790_a\(([^)]+)\)'),
+    re.compile(r'addCube\(([^)]+)\)')
+]
+_ROTATION_POINT_RES = [
+    re.compile(r'func_78793_a\(([^)]+)\)')
+]
+
+_LEG_CANDIDATES = [tuple(f'leg{leg_num}Seg{seg_num}' for seg_num in range(1, 6)) for leg_num in range(1, 9)]
+_LEG_CANDIDATES_LOWER = [tuple(name.lower() for name in leg_parts) for leg_parts in _LEG_CANDIDATES]
+
+_PART_SECTIONS = (
+    ('head', 'seg1', 'seg2', 'seg3', 'seg4', 'seg5', 'seg6', 'seg7', 'seg8'),
+    ('tailseg1', 'tailseg2', 'tailseg3', 'tailseg4', 'tailseg5', 'tailseg6', 'tailseg7', 'tailseg8', 'stinger1', 'stinger2', 'stinger3'),
+    ('leftShoulder', 'leftArmSeg1', 'leftArmSeg2', 'leftArmSeg3', 'leftArmSeg4', 'leftPincer'),
+    ('rightShoulder', 'rightArmSeg1', 'rightArmSeg2', 'rightArmSeg3', 'rightArmSeg4', 'rightPincer'),
+    ('leftEye', 'rightEye', 'leftMandible', 'rightMandible', 'leftManPart2', 'rightManPart2'),
+)
+
+_NUMBER_RE = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)')
+
+_BRACE_RE = re.compile(r'[{}]')
+_RENDER_CALL_RE = re.compile(r'this\.(\w+)\.render\([^)]*\);')
+
+_ADDCHILD_RE = re.compile(r'(\w+)\.addChild\((?:this\.)?(\w+)\);')
+
+
+_CONVERSION_CACHE_SIZE = 128
+_INDEX_PAGE_CACHE_SIZE = 8
+_CONVERSION_CACHE: 'OrderedDict[bytes, str]' = OrderedDict()
+_CONVERSION_CACHE_LOCK = threading.Lock()
+
+_MODEL_HEADER_TEMPLATE = """package %(package_name)s;
+
+import com.mojang.blaze3d.vertex.PoseStack;
+import com.mojang.blaze3d.vertex.VertexConsumer;
+import net.minecraft.client.model.EntityModel;
+import net.minecraft.client.model.geom.ModelPart;
+import net.minecraft.client.model.geom.PartPose;
+import net.minecraft.client.model.geom.builders.*;
+import net.minecraft.world.entity.Entity;
+
+import javax.annotation.Nonnull;
+
+public class %(class_name)s<T extends Entity> extends EntityModel<T> {
+
+    private final ModelPart root;
+"""
+
+_CONSTRUCTOR_HEADER_TEMPLATE = """
+    public %(class_name)s(ModelPart root) {
+        this.root = root;
+"""
+
+_BODY_LAYER_HEADER = """    }
+
+    public static LayerDefinition createBodyLayer() {
+        MeshDefinition meshdefinition = new MeshDefinition();
+        PartDefinition partdefinition = meshdefinition.getRoot();
+"""
+
+_MODEL_FOOTER_TEMPLATE = """
+        return LayerDefinition.create(meshdefinition, %(texture_width)s, %(texture_height)s);
+    }
+
+    @Override
+    public void renderToBuffer(@Nonnull PoseStack poseStack, @Nonnull VertexConsumer vertexConsumer, int packedLight, int packedOverlay, int color) {
+        root.render(poseStack, vertexConsumer, packedLight, packedOverlay, color);
+    }
+
+    @Override
+    public void setupAnim(T entity, float limbSwing, float limbSwingAmount, float ageInTicks, float netHeadYaw, float headPitch) {}
+}"""
+
+_PART_DEFINITION_TEMPLATE = ('addOrReplaceChild("%s", CubeListBuilder.create().texOffs(%d, %d).addBox(%.1ff, %.1ff, %.1ff, %d, %d, %d), '
+                             'PartPose.offsetAndRotation(%.1ff, %.1ff, %.1ff, %.3ff, %.3ff, %.3ff));')
+
+
+_CAPITALIZED_PART_NAMES = (
+    'LeftEye', 'RightEye', 'LeftShoulder', 'RightShoulder',
+    *(f'LeftArmSeg{seg_num}' for seg_num in range(1, 5)),
+    *(f'RightArmSeg{seg_num}' for seg_num in range(1, 5)),
+    'LeftPincer', 'RightPincer', 'LeftMandible', 'RightMandible', 'LeftManPart2', 'RightManPart2',
+    'Head',
+    *(f'Seg{seg_num}' for seg_num in range(1, 9)),
+    *(f'Tailseg{seg_num}' for seg_num in range(1, 9)),
+    *(f'Stinger{seg_num}' for seg_num in range(1, 4)),
+    *(f'Leg{leg_num}Seg{seg_num}' for leg_num in range(1, 9) for seg_num in range(1, 6))
+)
+
+_NAME_MAPPINGS = MappingProxyType({
+    **{name: name[0].lower() + name[1:] for name in _CAPITALIZED_PART_NAMES},
+    'lefteye': 'leftEye',
+    'righteye': 'rightEye',
+    'Lefteye': 'leftEye',
+    'Righteye': 'rightEye',
+    'body': 'head',
+    'Body': 'head',
+    'torso': 'seg1',
+    'Torso': 'seg1',
+    **{f'{prefix}{seg_num}': f'seg{seg_num}' for prefix in ('segment', 'Segment') for seg_num in range(1, 9)}
+})
+
+
+@dataclass(slots=True)
+class ModelPart:
+    name: str
+    coords: List[float] = field(default_factory=lambda: [0, 0, 0, 1, 1, 1])
+    rotation_point: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    initial_rotation: List[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    tex_u: int = 0
+    tex_v: int = 0
+    mirror: bool = True
+
+
+@dataclass(slots=True)
+class ModelInfo:
+    package_name: str = ''
+    class_name: str = ''
+    texture_width: int = 256
+    texture_height: int = 128
+    model_parts: List[ModelPart] = field(default_factory=list)
+    render_parts: List[str] = field(default_factory=list)
+    part_hierarchy: Dict[str, str] = field(default_factory=dict)
+
 
 def convert_model_code(code_input: str) -> str:
+    if 'extends EntityModel' in code_input and 'ModelRenderer' not in code_input:
+        return code_input
+
+    cache_key = hashlib.blake2b(code_input.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    with _CONVERSION_CACHE_LOCK:
+        converted_code = _CONVERSION_CACHE.get(cache_key)
+        if converted_code is not None:
+            _CONVERSION_CACHE.move_to_end(cache_key)
+            return converted_code
+
     model_info = extract_model_info(code_input)
 
     model_info = validate_and_fix_model_info(model_info)
 
     converted_code = generate_modern_model(model_info)
 
+    with _CONVERSION_CACHE_LOCK:
+        _CONVERSION_CACHE[cache_key] = converted_code
+        if len(_CONVERSION_CACHE) > _CONVERSION_CACHE_SIZE:
+            _CONVERSION_CACHE.popitem(last=False)
+
     return converted_code
 
 
-def validate_and_fix_model_info(model_info: Dict) -> Dict:
-    fixed_parts = []
-    for part in model_info.get('model_parts', []):
-        coords = part.get('coords', [0, 0, 0, 1, 1, 1])
+def validate_and_fix_model_info(model_info: ModelInfo) -> ModelInfo:
+    for part in model_info.model_parts:
+        coords = part.coords
         if len(coords) < 6:
             coords.extend([1, 1, 1][len(coords)-3:])
 
@@ -27,140 +224,179 @@ def validate_and_fix_model_info(model_info: Dict) -> Dict:
             coords[4] = max(1, abs(coords[4]))
             coords[5] = max(1, abs(coords[5]))
 
-        rotation_point = part.get('rotation_point', [0.0, 0.0, 0.0])
-        if len(rotation_point) < 3:
-            rotation_point.extend([0.0] * (3 - len(rotation_point)))
+        if len(part.rotation_point) < 3:
+            part.rotation_point.extend([0.0] * (3 - len(part.rotation_point)))
 
-        initial_rotation = part.get('initial_rotation', [0.0, 0.0, 0.0])
-        if len(initial_rotation) < 3:
-            initial_rotation.extend([0.0] * (3 - len(initial_rotation)))
+        if len(part.initial_rotation) < 3:
+            part.initial_rotation.extend([0.0] * (3 - len(part.initial_rotation)))
 
-        tex_u = part.get('tex_u', 0)
-        tex_v = part.get('tex_v', 0)
-        if not isinstance(tex_u, int) or tex_u < 0:
-            tex_u = 0
-        if not isinstance(tex_v, int) or tex_v < 0:
-            tex_v = 0
+        if not isinstance(part.tex_u, int) or part.tex_u < 0:
+            part.tex_u = 0
+        if not isinstance(part.tex_v, int) or part.tex_v < 0:
+            part.tex_v = 0
 
-        fixed_part = {
-            'name': part.get('name', 'unknown'),
-            'coords': coords,
-            'rotation_point': rotation_point,
-            'initial_rotation': initial_rotation,
-            'tex_u': tex_u,
-            'tex_v': tex_v,
-            'mirror': part.get('mirror', True)
-        }
-
-        fixed_parts.append(fixed_part)
-
-    model_info['model_parts'] = fixed_parts
-
-    if model_info.get('texture_width', 0) <= 0:
-        model_info['texture_width'] = 256
-    if model_info.get('texture_height', 0) <= 0:
-        model_info['texture_height'] = 128
+    if model_info.texture_width <= 0:
+        model_info.texture_width = 256
+    if model_info.texture_height <= 0:
+        model_info.texture_height = 128
 
     return model_info
 
 
-def extract_model_info(code: str) -> Dict:
-    info = {
-        'package_name': '',
-        'class_name': '',
-        'texture_width': 256,
-        'texture_height': 128,
-        'model_parts': [],
-        'render_parts': []
-    }
+def extract_model_info(code: str) -> ModelInfo:
+    info = ModelInfo()
 
-    package_match = re.search(r'package\s+([\w\.]+);', code)
+    package_match = _PACKAGE_RE.search(code)
     if package_match:
         original_package = package_match.group(1)
         if 'entities' in original_package or 'models' in original_package:
-            info['package_name'] = 'me.mglucas0123.neospawn.entity.monster.'
+            info.package_name = 'me.mglucas0123.neospawn.entity.monster.'
         else:
-            info['package_name'] = original_package
+            info.package_name = original_package
 
-    class_match = re.search(r'public\s+class\s+(\w+)\s+extends\s+ModelBase', code)
+    class_match = _CLASS_RE.search(code)
     if class_match:
-        info['class_name'] = class_match.group(1)
+        info.class_name = class_match.group(1)
 
-    texture_width_match = re.search(r'this\.textureWidth\s*=\s*(\d+)', code)
+    texture_width_match = _TEXTURE_WIDTH_RE.search(code)
     if texture_width_match:
-        info['texture_width'] = int(texture_width_match.group(1))
+        info.texture_width = int(texture_width_match.group(1))
 
-    texture_height_match = re.search(r'this\.textureHeight\s*=\s*(\d+)', code)
+    texture_height_match = _TEXTURE_HEIGHT_RE.search(code)
     if texture_height_match:
-        info['texture_height'] = int(texture_height_match.group(1))
+        info.texture_height = int(texture_height_match.group(1))
 
-    info['model_parts'] = extract_model_parts_advanced(code)
+    if 'ModelRenderer' not in code:
+        return info
 
-    info['render_parts'] = extract_render_parts_advanced(code)
+    info.model_parts = extract_model_parts_advanced(code)
 
-    info['part_hierarchy'] = extract_part_hierarchy(code)
+    info.render_parts = extract_render_parts_advanced(code)
+
+    info.part_hierarchy = extract_part_hierarchy(code)
 
     return info
 
 
-def extract_model_parts_advanced(code: str) -> List[Dict]:
+def extract_model_parts_advanced(code: str) -> List[ModelPart]:
     parts = []
 
-    part_declarations = []
-    patterns = [
-        r'ModelRenderer\s+(\w+);',
-        r'private\s+ModelRenderer\s+(\w+);',
-        r'public\s+ModelRenderer\s+(\w+);',
-        r'protected\s+ModelRenderer\s+(\w+);',
-        r'ModelRenderer\s+(\w+)\s*=',
-        r'this\.(\w+)\s*=\s*new\s+ModelRenderer',
-        r'(\w+)\s*=\s*new\s+ModelRenderer\(',
-        r'private\s+final\s+ModelRenderer\s+(\w+);',
-        r'public\s+final\s+ModelRenderer\s+(\w+);'
-    ]
+    part_declarations = {}
 
-    for pattern in patterns:
-        matches = re.findall(pattern, code)
-        for match in matches:
-            if match and match.isalnum() and not match.isdigit() and match not in part_declarations:
-                part_declarations.append(match)
-
-    unique_declarations = []
-    seen = set()
-    for part in part_declarations:
-        if part not in seen:
-            unique_declarations.append(part)
-            seen.add(part)
-
-    for part_name in unique_declarations:
-        part_info = extract_single_part_info(code, part_name)
+    for pattern in _PART_DECLARATION_RES:
+        part_declarations.update(dict.fromkeys(pattern.findall(code)))
+
+    statement_index = index_part_statements(code)
+    part_sites = index_part_sites(code)
+
+    for part_name in part_declarations:
+        if not part_name or not part_name.isalnum() or part_name.isdigit():
+            continue
+
+        part_info = extract_single_part_info(code, part_name, statement_index, part_sites)
         parts.append(part_info)
 
     return parts
 
 
-def extract_single_part_info(code: str, part_name: str) -> Dict:
-    part_info = {
-        'name': part_name,
-        'coords': [0, 0, 0, 1, 1, 1],
-        'rotation_point': [0.0, 0.0, 0.0],
-        'initial_rotation': [0.0, 0.0, 0.0],
-        'tex_u': 0,
-        'tex_v': 0,
-        'mirror': True
-    }
+@lru_cache(maxsize=2048)
+def compile_part_pattern(template: str, flags: int, part_name: str) -> re.Pattern:
+    return re.compile(template.format(name=re.escape(part_name)), flags)
+
+
+def index_part_statements(code: str) -> Dict[str, Dict[str, str]]:
+    index = {}
+
+    for match in _PART_STATEMENT_RE.finditer(code):
+        if match.group('name'):
+            name = match.group('name')
+            aspect = match.lastgroup
+        elif match.group('rotation_name'):
+            name = match.group('rotation_name')
+            aspect = 'rotation'
+        else:
+            name = match.group('set_rotation_name')
+            aspect = 'set_rotation'
+
+        value = match.group(match.lastgroup)
+        index.setdefault(name, {}).setdefault(aspect, value)
+
+    return index
 
-    part_block_patterns = [
-        rf'(this\.{part_name}\s*=\s*new\s+ModelRenderer[^;]+;[\s\S]*?)(?=this\.\w+\s*=\s*new\s+ModelRenderer|private\s+|public\s+|protected\s+|$)',
-        rf'({part_name}\s*=\s*new\s+ModelRenderer[^;]+;[\s\S]*?)(?=\w+\s*=\s*new\s+ModelRenderer|private\s+|public\s+|protected\s+|$)'
-    ]
+
+def index_part_sites(code: str) -> Dict[str, List[Optional[int]]]:
+    sites = {}
+
+    for match in _PART_SITE_RE.finditer(code):
+        part_sites = sites.setdefault(match.group(2), [None, None])
+        if match.group(1):
+            if part_sites[0] is None:
+                part_sites[0] = match.start()
+        elif part_sites[1] is None:
+            part_sites[1] = match.start(2)
+
+    return sites
+
+
+def iter_statement_args(indexed: Optional[str], patterns: List[re.Pattern], part_block: str, code: str):
+    if indexed is not None:
+        yield indexed
+
+    for pattern in patterns:
+        match = pattern.search(part_block)
+        if not match:
+            match = pattern.search(code)
+
+        if match:
+            yield match.group(1)
+
+
+def parse_numeric_args(args_str: str, count: int, as_float: bool = True) -> Optional[List]:
+    args = args_str.split(',')
+    if len(args) < count:
+        return None
+
+    values = []
+    for arg in args[:count]:
+        number_match = _NUMBER_RE.search(arg)
+        if not number_match:
+            values.append(0.0 if as_float else 0)
+        elif as_float or '.' in number_match.group():
+            values.append(float(number_match.group()))
+        else:
+            values.append(int(number_match.group()))
+
+    return values
+
+
+def extract_single_part_info(code: str, part_name: str, statement_index: Optional[Dict[str, Dict[str, str]]] = None,
+                             part_sites: Optional[Dict[str, List[Optional[int]]]] = None) -> ModelPart:
+    part_info = ModelPart(part_name)
+
+    if statement_index is None:
+        statement_index = index_part_statements(code)
+
+    statements = statement_index.get(part_name, {})
+
+    if part_sites is None:
+        part_sites = index_part_sites(code)
 
     part_block = ""
-    for pattern in part_block_patterns:
-        block_match = re.search(pattern, code, re.MULTILINE)
-        if block_match:
-            part_block = block_match.group(1)
-            break
+    block_match = None
+    for (template, flags), site in zip(_PART_BLOCK_TEMPLATES, part_sites.get(part_name, ())):
+        if site is not None:
+            block_match = compile_part_pattern(template, flags, part_name).match(code, site)
+            if block_match:
+                break
+
+    if block_match:
+        part_block = block_match.group(1)
+    else:
+        for template, flags in _PART_BLOCK_TEMPLATES:
+            block_match = compile_part_pattern(template, flags, part_name).search(code)
+            if block_match:
+                part_block = block_match.group(1)
+                break
 
     if not part_block:
         lines = code.split('\n')
@@ -169,317 +405,132 @@ def extract_single_part_info(code: str, part_name: str) -> Dict:
                 part_block = '\n'.join(lines[i:i+10])
                 break
 
-    tex_patterns = [
-        rf'new\s+ModelRenderer\([^,]*,\s*(\d+),\s*(\d+)\)',
-        rf'setTextureOffset\((\d+),\s*(\d+)\)',
-        rf'setTextureSize\((\d+),\s*(\d+)\)'
-    ]
-
-    for pattern in tex_patterns:
-        tex_match = re.search(pattern, part_block)
+    for pattern in _TEXTURE_OFFSET_RES:
+        tex_match = pattern.search(part_block)
         if tex_match:
-            part_info['tex_u'] = int(tex_match.group(1))
-            part_info['tex_v'] = int(tex_match.group(2))
+            part_info.tex_u = int(tex_match.group(1))
+            part_info.tex_v = int(tex_match.group(2))
             break
 
-    addbox_patterns = [
-        rf'{part_name}\.addBox\(([^)]+)\)',
-        rf'this\.{part_name}\.addBox\(([^)]+)\)',
-        rf'addBox\(([^)]+)\)',
-        rf'func_78790_a\(([^)]+)\)',
-        rf'addCube\(([^)]+)\)'
-    ]
-
-    for pattern in addbox_patterns:
-        addbox_match = re.search(pattern, part_block)
-        if not addbox_match:
-            addbox_match = re.search(pattern, code)
-
-        if addbox_match:
-            coords_str = addbox_match.group(1)
-
-            coords_clean = re.sub(r'[fF]', '', coords_str)
-            coords_clean = re.sub(r'\s+', ' ', coords_clean)
-            coords_parts = [x.strip() for x in coords_clean.split(',')]
-
-            if len(coords_parts) >= 6:
-                try:
-                    parsed_coords = []
-                    for coord in coords_parts[:6]:
-                        clean_coord = re.sub(r'[^\d\.\-\+]', '', coord)
-                        if clean_coord and clean_coord not in ['-', '+', '.', '']:
-                            if '.' in clean_coord:
-                                parsed_coords.append(float(clean_coord))
-                            else:
-                                parsed_coords.append(int(clean_coord))
-                        else:
-                            parsed_coords.append(0)
-
-                    if len(parsed_coords) == 6:
-                        part_info['coords'] = parsed_coords
-                        break
-                except (ValueError, IndexError):
-                    continue
-
-    rotation_patterns = [
-        rf'{part_name}\.setRotationPoint\(([^)]+)\)',
-        rf'this\.{part_name}\.setRotationPoint\(([^)]+)\)',
-        rf'setRotationPoint\({part_name}[^,]*,\s*([^)]+)\)',
-        rf'func_78793_a\(([^)]+)\)'
-    ]
-
-    for pattern in rotation_patterns:
-        rotation_match = re.search(pattern, part_block)
-        if not rotation_match:
-            rotation_match = re.search(pattern, code)
-
-        if rotation_match:
-            rotation_str = rotation_match.group(1)
-            rotation_clean = re.sub(r'[fF]', '', rotation_str)
-            rotation_parts = [x.strip() for x in rotation_clean.split(',')]
-
-            if len(rotation_parts) >= 3:
-                try:
-                    parsed_rotation = []
-                    for rot in rotation_parts[:3]:
-                        clean_rot = re.sub(r'[^\d\.\-\+]', '', rot)
-                        if clean_rot and clean_rot not in ['-', '+', '.']:
-                            parsed_rotation.append(float(clean_rot))
-                        else:
-                            parsed_rotation.append(0.0)
-
-                    if len(parsed_rotation) == 3:
-                        part_info['rotation_point'] = parsed_rotation
-                        break
-                except (ValueError, IndexError):
-                    continue
-
-    if part_info['rotation_point'] == [0.0, 0.0, 0.0]:
-        alt_patterns = [
-            rf'{part_name}[^=]*=\s*new\s+ModelRenderer[^;]+;\s*\n[^;]*setRotationPoint\(([^)]+)\)',
-            rf'new\s+ModelRenderer[^;]+;\s*{part_name}\.setRotationPoint\(([^)]+)\)'
-        ]
-
-        for pattern in alt_patterns:
-            alt_match = re.search(pattern, code, re.DOTALL)
-            if alt_match:
-                rotation_str = alt_match.group(1)
-                rotation_clean = re.sub(r'[fF]', '', rotation_str)
-                rotation_parts = [x.strip() for x in rotation_clean.split(',')]
-
-                if len(rotation_parts) >= 3:
-                    try:
-                        parsed_rotation = []
-                        for rot in rotation_parts[:3]:
-                            clean_rot = re.sub(r'[^\d\.\-\+]', '', rot)
-                            if clean_rot and clean_rot not in ['-', '+', '.']:
-                                parsed_rotation.append(float(clean_rot))
-                            else:
-                                parsed_rotation.append(0.0)
-
-                        if len(parsed_rotation) == 3:
-                            part_info['rotation_point'] = parsed_rotation
-                            break
-                    except (ValueError, IndexError):
-                        continue
-
-    set_rotation_patterns = [
-        rf'setRotation\([^,]*{part_name}[^,]*,\s*([^)]+)\)'
-    ]
-
-    for pattern in set_rotation_patterns:
-        set_rotation_match = re.search(pattern, code)
-        if set_rotation_match:
-            rotation_str = set_rotation_match.group(1)
-            rotation_clean = re.sub(r'[fF]', '', rotation_str)
-            rotation_parts = [x.strip() for x in rotation_clean.split(',')]
-
-            if len(rotation_parts) >= 3:
-                try:
-                    parsed_rotation = []
-                    for rot in rotation_parts[:3]:
-                        clean_rot = re.sub(r'[^\d\.\-]', '', rot)
-                        if clean_rot:
-                            parsed_rotation.append(float(clean_rot))
-                        else:
-                            parsed_rotation.append(0.0)
-
-                    if len(parsed_rotation) == 3:
-                        part_info['initial_rotation'] = parsed_rotation
-                except (ValueError, IndexError):
-                    pass
+    for coords_str in iter_statement_args(statements.get('addbox'), _ADDBOX_RES, part_block, code):
+        parsed_coords = parse_numeric_args(coords_str, 6, as_float=False)
+        if parsed_coords:
+            part_info.coords = parsed_coords
             break
 
-    mirror_patterns = [
-        rf'{part_name}\.mirror\s*=\s*(true|false)',
-        rf'this\.{part_name}\.mirror\s*=\s*(true|false)'
-    ]
-
-    for pattern in mirror_patterns:
-        mirror_match = re.search(pattern, part_block)
-        if mirror_match:
-            part_info['mirror'] = mirror_match.group(1) == 'true'
+    for rotation_str in iter_statement_args(statements.get('rotation'), _ROTATION_POINT_RES, part_block, code):
+        parsed_rotation = parse_numeric_args(rotation_str, 3)
+        if parsed_rotation:
+            part_info.rotation_point = parsed_rotation
             break
 
+    if part_info.rotation_point == [0.0, 0.0, 0.0]:
+        for template, flags in _PART_ALT_ROTATION_TEMPLATES:
+            alt_match = compile_part_pattern(template, flags, part_name).search(code)
+            if alt_match:
+                parsed_rotation = parse_numeric_args(alt_match.group(1), 3)
+                if parsed_rotation:
+                    part_info.rotation_point = parsed_rotation
+                    break
+
+    rotation_str = statements.get('set_rotation')
+    if rotation_str:
+        parsed_rotation = parse_numeric_args(rotation_str, 3)
+        if parsed_rotation:
+            part_info.initial_rotation = parsed_rotation
+
+    mirror = statements.get('mirror')
+    if mirror:
+        part_info.mirror = mirror == 'true'
+
     return part_info
 
 
 def extract_render_parts_advanced(code: str) -> List[str]:
-    render_parts = []
-
-    render_section = re.search(r'public void render\([^{]+\{(.*?)\}', code, re.DOTALL)
-    if render_section:
-        render_content = render_section.group(1)
-        render_calls = re.findall(r'this\.(\w+)\.render\([^)]*\);', render_content)
-        render_parts = render_calls
+    start = code.find('public void render(')
+    if start < 0:
+        return []
+
+    body_start = code.find('{', start)
+    if body_start < 0:
+        return []
+
+    depth = 0
+    body_end = len(code)
+    for brace in _BRACE_RE.finditer(code, body_start):
+        if brace.group() == '{':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                body_end = brace.start()
+                break
 
-    return render_parts
+    return _RENDER_CALL_RE.findall(code, body_start + 1, body_end)
 
 
 def extract_part_hierarchy(code: str) -> Dict[str, str]:
     hierarchy = {}
 
-    addchild_patterns = [
-        r'this\.(\w+)\.addChild\(this\.(\w+)\);',
-        r'(\w+)\.addChild\(this\.(\w+)\);',
-        r'this\.(\w+)\.addChild\((\w+)\);',
-        r'(\w+)\.addChild\((\w+)\);'
-    ]
+    if '.addChild(' not in code:
+        return hierarchy
 
-    for pattern in addchild_patterns:
-        matches = re.findall(pattern, code)
-        for parent, child in matches:
-            parent_normalized = normalize_part_name(parent)
-            child_normalized = normalize_part_name(child)
-            hierarchy[child_normalized] = parent_normalized
+    for parent, child in _ADDCHILD_RE.findall(code):
+        parent_normalized = normalize_part_name(parent)
+        child_normalized = normalize_part_name(child)
+        hierarchy[child_normalized] = parent_normalized
 
     return hierarchy
 
 
-def generate_modern_model(info: Dict) -> str:
-    class_name = info['class_name']
-    package_name = info['package_name']
-    texture_width = info['texture_width']
-    texture_height = info['texture_height']
-    parts = info['model_parts']
+def generate_modern_model(info: ModelInfo) -> str:
+    class_name = info.class_name
+    package_name = info.package_name
+    texture_width = info.texture_width
+    texture_height = info.texture_height
+    parts = info.model_parts
 
     if class_name.startswith('Model'):
         modern_class_name = class_name
     else:
         modern_class_name = class_name + 'Model'
 
-    code = f"""package {package_name};
-
-import com.mojang.blaze3d.vertex.PoseStack;
-import com.mojang.blaze3d.vertex.VertexConsumer;
-import net.minecraft.client.model.EntityModel;
-import net.minecraft.client.model.geom.ModelPart;
-import net.minecraft.client.model.geom.PartPose;
-import net.minecraft.client.model.geom.builders.*;
-import net.minecraft.world.entity.Entity;
-
-import javax.annotation.Nonnull;
-
-public class {modern_class_name}<T extends Entity> extends EntityModel<T> {{
-
-    private final ModelPart root;
-
-{generate_part_declarations_precise(parts)}
-
-    public {modern_class_name}(ModelPart root) {{
-        this.root = root;
-
-{generate_constructor_assignments_precise(parts)}
-    }}
-
-    public static LayerDefinition createBodyLayer() {{
-        MeshDefinition meshdefinition = new MeshDefinition();
-        PartDefinition partdefinition = meshdefinition.getRoot();
+    normalized_names = frozenset(normalize_part_name(p.name) for p in parts)
 
-{generate_part_definitions_precise(parts, info.get('part_hierarchy', {}))}
+    buf = [_MODEL_HEADER_TEMPLATE % {'package_name': package_name, 'class_name': modern_class_name}]
+    generate_part_declarations_precise(normalized_names, buf)
+    buf.append(_CONSTRUCTOR_HEADER_TEMPLATE % {'class_name': modern_class_name})
+    generate_constructor_assignments_precise(normalized_names, buf)
+    buf.append(_BODY_LAYER_HEADER)
+    generate_part_definitions_precise(parts, buf, info.part_hierarchy)
+    buf.append(_MODEL_FOOTER_TEMPLATE % {'texture_width': texture_width, 'texture_height': texture_height})
 
-        return LayerDefinition.create(meshdefinition, {texture_width}, {texture_height});
-    }}
+    return "\n".join(buf)
 
-    @Override
-    public void renderToBuffer(@Nonnull PoseStack poseStack, @Nonnull VertexConsumer vertexConsumer, int packedLight, int packedOverlay, int color) {{
-        root.render(poseStack, vertexConsumer, packedLight, packedOverlay, color);
-    }}
+def generate_part_declarations_precise(normalized_names: frozenset, out: List[str]) -> None:
+    if not normalized_names:
+        out.append("    // Nenhuma parte encontrada")
+        return
 
-    @Override
-    public void setupAnim(T entity, float limbSwing, float limbSwingAmount, float ageInTicks, float netHeadYaw, float headPitch) {{}}
-}}"""
+    out.extend(render_part_declarations(normalized_names))
 
-    return code
 
-def generate_part_declarations_precise(parts: List[Dict]) -> str:
-    if not parts:
-        return "    // Nenhuma parte encontrada"
+@lru_cache(maxsize=64)
+def render_part_declarations(normalized_names: frozenset) -> Tuple[str, ...]:
+    norm_by_lower = {name.lower(): name for name in sorted(normalized_names)}
 
     declarations = []
 
-    body_parts = ['head', 'seg1', 'seg2', 'seg3', 'seg4', 'seg5', 'seg6', 'seg7', 'seg8']
-    found_body_parts = []
-    for part_name in body_parts:
-        if any(normalize_part_name(p['name']) == part_name for p in parts):
-            found_body_parts.append(part_name)
+    for section in _PART_SECTIONS:
+        found_parts = [part_name for part_name in section if part_name in normalized_names]
 
-    if found_body_parts:
-        for part in found_body_parts:
-            declarations.append(f"    private final ModelPart {part};")
-        if found_body_parts:
+        if found_parts:
+            for part in found_parts:
+                declarations.append(f"    private final ModelPart {part};")
             declarations.append("")
 
-    tail_parts = ['tailseg1', 'tailseg2', 'tailseg3', 'tailseg4', 'tailseg5', 'tailseg6', 'tailseg7', 'tailseg8', 'stinger1', 'stinger2', 'stinger3']
-    found_tail_parts = []
-    for part_name in tail_parts:
-        if any(normalize_part_name(p['name']) == part_name for p in parts):
-            found_tail_parts.append(part_name)
-
-    if found_tail_parts:
-        for part in found_tail_parts:
-            declarations.append(f"    private final ModelPart {part};")
-        declarations.append("")
-
-    left_arm_parts = ['leftShoulder', 'leftArmSeg1', 'leftArmSeg2', 'leftArmSeg3', 'leftArmSeg4', 'leftPincer']
-    found_left_parts = []
-    for part_name in left_arm_parts:
-        if any(normalize_part_name(p['name']) == part_name for p in parts):
-            found_left_parts.append(part_name)
-
-    if found_left_parts:
-        for part in found_left_parts:
-            declarations.append(f"    private final ModelPart {part};")
-        declarations.append("")
-
-    right_arm_parts = ['rightShoulder', 'rightArmSeg1', 'rightArmSeg2', 'rightArmSeg3', 'rightArmSeg4', 'rightPincer']
-    found_right_parts = []
-    for part_name in right_arm_parts:
-        if any(normalize_part_name(p['name']) == part_name for p in parts):
-            found_right_parts.append(part_name)
-
-    if found_right_parts:
-        for part in found_right_parts:
-            declarations.append(f"    private final ModelPart {part};")
-        declarations.append("")
-
-    head_parts = ['leftEye', 'rightEye', 'leftMandible', 'rightMandible', 'leftManPart2', 'rightManPart2']
-    found_head_parts = []
-    for part_name in head_parts:
-        if any(normalize_part_name(p['name']) == part_name for p in parts):
-            found_head_parts.append(part_name)
-
-    if found_head_parts:
-        for part in found_head_parts:
-            declarations.append(f"    private final ModelPart {part};")
-        declarations.append("")
-
-    for leg_num in range(1, 9):
-        leg_parts_for_num = [f'leg{leg_num}Seg1', f'leg{leg_num}Seg2', f'leg{leg_num}Seg3', f'leg{leg_num}Seg4', f'leg{leg_num}Seg5']
-        found_leg_parts = []
-        for part_name in leg_parts_for_num:
-            if any(normalize_part_name(p['name']).lower() == part_name.lower() for p in parts):
-                found_leg_parts.append(part_name)
+    for leg_parts_lower in _LEG_CANDIDATES_LOWER:
+        found_leg_parts = [norm_by_lower[part_lower] for part_lower in leg_parts_lower if part_lower in norm_by_lower]
 
         if found_leg_parts:
             declarations.append("    private final ModelPart " + ", ".join(found_leg_parts) + ";")
@@ -487,116 +538,67 @@ def generate_part_declarations_precise(parts: List[Dict]) -> str:
     while declarations and declarations[-1] == "":
         declarations.pop()
 
-    return '\n'.join(declarations)
+    return tuple(declarations) if declarations else ("",)
 
 
-def generate_constructor_assignments_precise(parts: List[Dict]) -> str:
-    if not parts:
-        return "        // Nenhuma parte encontrada"
+def generate_constructor_assignments_precise(normalized_names: frozenset, out: List[str]) -> None:
+    if not normalized_names:
+        out.append("        // Nenhuma parte encontrada")
+        return
 
-    assignments = []
+    out.extend(render_constructor_assignments(normalized_names))
 
-    body_parts = ['head', 'seg1', 'seg2', 'seg3', 'seg4', 'seg5', 'seg6', 'seg7', 'seg8']
-    found_body_parts = []
-    for part_name in body_parts:
-        if any(normalize_part_name(p['name']) == part_name for p in parts):
-            found_body_parts.append(part_name)
 
-    if found_body_parts:
-        for part in found_body_parts:
-            assignments.append(f'        this.{part} = root.getChild("{part}");')
-        if found_body_parts:
-            assignments.append("")
+@lru_cache(maxsize=64)
+def render_constructor_assignments(normalized_names: frozenset) -> Tuple[str, ...]:
+    norm_by_lower = {name.lower(): name for name in sorted(normalized_names)}
 
-    tail_parts = ['tailseg1', 'tailseg2', 'tailseg3', 'tailseg4', 'tailseg5', 'tailseg6', 'tailseg7', 'tailseg8', 'stinger1', 'stinger2', 'stinger3']
-    found_tail_parts = []
-    for part_name in tail_parts:
-        if any(normalize_part_name(p['name']) == part_name for p in parts):
-            found_tail_parts.append(part_name)
-
-    if found_tail_parts:
-        for part in found_tail_parts:
-            assignments.append(f'        this.{part} = root.getChild("{part}");')
-        assignments.append("")
-
-    left_arm_parts = ['leftShoulder', 'leftArmSeg1', 'leftArmSeg2', 'leftArmSeg3', 'leftArmSeg4', 'leftPincer']
-    found_left_parts = []
-    for part_name in left_arm_parts:
-        if any(normalize_part_name(p['name']) == part_name for p in parts):
-            found_left_parts.append(part_name)
-
-    if found_left_parts:
-        for part in found_left_parts:
-            assignments.append(f'        this.{part} = root.getChild("{part}");')
-        assignments.append("")
-
-    right_arm_parts = ['rightShoulder', 'rightArmSeg1', 'rightArmSeg2', 'rightArmSeg3', 'rightArmSeg4', 'rightPincer']
-    found_right_parts = []
-    for part_name in right_arm_parts:
-        if any(normalize_part_name(p['name']) == part_name for p in parts):
-            found_right_parts.append(part_name)
-
-    if found_right_parts:
-        for part in found_right_parts:
-            assignments.append(f'        this.{part} = root.getChild("{part}");')
-        assignments.append("")
-
-    head_parts = ['leftEye', 'rightEye', 'leftMandible', 'rightMandible', 'leftManPart2', 'rightManPart2']
-    found_head_parts = []
-    for part_name in head_parts:
-        if any(normalize_part_name(p['name']) == part_name for p in parts):
-            found_head_parts.append(part_name)
-
-    if found_head_parts:
-        for part in found_head_parts:
-            assignments.append(f'        this.{part} = root.getChild("{part}");')
-        assignments.append("")
-
-    for leg_num in range(1, 9):
-        leg_parts_for_num = [f'leg{leg_num}Seg1', f'leg{leg_num}Seg2', f'leg{leg_num}Seg3', f'leg{leg_num}Seg4', f'leg{leg_num}Seg5']
-        found_leg_parts = []
-        for part_name in leg_parts_for_num:
-            if any(normalize_part_name(p['name']).lower() == part_name.lower() for p in parts):
-                found_leg_parts.append(part_name)
+    found_sections = [[part_name for part_name in section if part_name in normalized_names] for section in _PART_SECTIONS]
+    found_sections.extend([norm_by_lower[part_lower] for part_lower in leg_parts_lower if part_lower in norm_by_lower]
+                          for leg_parts_lower in _LEG_CANDIDATES_LOWER)
 
-        if found_leg_parts:
-            for part in found_leg_parts:
+    assignments = []
+
+    for found_parts in found_sections:
+        if found_parts:
+            for part in found_parts:
                 assignments.append(f'        this.{part} = root.getChild("{part}");')
             assignments.append("")
 
     if assignments and assignments[-1] == "":
         assignments.pop()
 
-    return '\n'.join(assignments)
+    return tuple(assignments) if assignments else ("",)
 
 
-def generate_part_definitions_precise(parts: List[Dict], hierarchy: Dict[str, str] = None) -> str:
+def generate_part_definitions_precise(parts: List[ModelPart], out: List[str], hierarchy: Dict[str, str] = None) -> None:
     if not parts:
-        return "        // Nenhuma parte encontrada"
+        out.append("        // Nenhuma parte encontrada")
+        return
 
     if hierarchy is None:
         hierarchy = {}
 
-    definitions = []
+    start = len(out)
     processed_parents = set()
 
     root_parts = []
     child_parts = []
 
     for part in parts:
-        normalized_name = normalize_part_name(part['name'])
+        normalized_name = normalize_part_name(part.name)
         if normalized_name in hierarchy:
             child_parts.append(part)
         else:
             root_parts.append(part)
 
     for part in root_parts:
-        name = normalize_part_name(part['name'])
-        coords = part['coords']
-        rotation_point = part['rotation_point']
-        initial_rotation = part['initial_rotation']
-        tex_u = part['tex_u']
-        tex_v = part['tex_v']
+        name = normalize_part_name(part.name)
+        coords = part.coords
+        rotation_point = part.rotation_point
+        initial_rotation = part.initial_rotation
+        tex_u = part.tex_u
+        tex_v = part.tex_v
 
         if len(coords) >= 6 and all(isinstance(coord, (int, float)) for coord in coords):
             x, y, z, width, height, depth = coords[:6]
@@ -605,18 +607,19 @@ def generate_part_definitions_precise(parts: List[Dict], hierarchy: Dict[str, st
             height = max(1, abs(int(height)))
             depth = max(1, abs(int(depth)))
 
-            definition = f'''        partdefinition.addOrReplaceChild("{name}", CubeListBuilder.create().texOffs({tex_u}, {tex_v}).addBox({x:.1f}f, {y:.1f}f, {z:.1f}f, {width}, {height}, {depth}), PartPose.offsetAndRotation({rotation_point[0]:.1f}f, {rotation_point[1]:.1f}f, {rotation_point[2]:.1f}f, {initial_rotation[0]:.3f}f, {initial_rotation[1]:.3f}f, {initial_rotation[2]:.3f}f));'''
+            definition = "        partdefinition." + _PART_DEFINITION_TEMPLATE % (
+                name, tex_u, tex_v, x, y, z, width, height, depth, *rotation_point[:3], *initial_rotation[:3])
 
-        definitions.append(definition)
+        out.append(definition)
 
     for part in child_parts:
-        name = normalize_part_name(part['name'])
+        name = normalize_part_name(part.name)
         parent_name = hierarchy[name]
-        coords = part['coords']
-        rotation_point = part['rotation_point']
-        initial_rotation = part['initial_rotation']
-        tex_u = part['tex_u']
-        tex_v = part['tex_v']
+        coords = part.coords
+        rotation_point = part.rotation_point
+        initial_rotation = part.initial_rotation
+        tex_u = part.tex_u
+        tex_v = part.tex_v
 
         if len(coords) >= 6 and all(isinstance(coord, (int, float)) for coord in coords):
             x, y, z, width, height, depth = coords[:6]
@@ -632,152 +635,110 @@ def generate_part_definitions_precise(parts: List[Dict], hierarchy: Dict[str, st
             else:
                 parent_declaration = "        "
 
-            definition = f'''{parent_declaration}{parent_name}Def.addOrReplaceChild("{name}", CubeListBuilder.create().texOffs({tex_u}, {tex_v}).addBox({x:.1f}f, {y:.1f}f, {z:.1f}f, {width}, {height}, {depth}), PartPose.offsetAndRotation({rotation_point[0]:.1f}f, {rotation_point[1]:.1f}f, {rotation_point[2]:.1f}f, {initial_rotation[0]:.3f}f, {initial_rotation[1]:.3f}f, {initial_rotation[2]:.3f}f));'''
+            definition = parent_declaration + parent_name + "Def." + _PART_DEFINITION_TEMPLATE % (
+                name, tex_u, tex_v, x, y, z, width, height, depth, *rotation_point[:3], *initial_rotation[:3])
 
-            definitions.append(definition)
+            out.append(definition)
 
-    return '\n'.join(definitions) if definitions else "        // Nenhuma definição de parte encontrada"
+    if len(out) == start:
+        out.append("        // Nenhuma definição de parte encontrada")
 
 
+@lru_cache(maxsize=1024)
 def normalize_part_name(old_name: str) -> str:
-    name_mappings = {
-        'lefteye': 'leftEye',
-        'righteye': 'rightEye',
-        'Lefteye': 'leftEye',
-        'Righteye': 'rightEye',
-        'LeftEye': 'leftEye',
-        'RightEye': 'rightEye',
-        'LeftShoulder': 'leftShoulder',
-        'RightShoulder': 'rightShoulder',
-        'leftShoulder': 'leftShoulder',
-        'rightShoulder': 'rightShoulder',
-        'LeftArmSeg1': 'leftArmSeg1',
-        'LeftArmSeg2': 'leftArmSeg2',
-        'LeftArmSeg3': 'leftArmSeg3',
-        'LeftArmSeg4': 'leftArmSeg4',
-        'RightArmSeg1': 'rightArmSeg1',
-        'RightArmSeg2': 'rightArmSeg2',
-        'RightArmSeg3': 'rightArmSeg3',
-        'RightArmSeg4': 'rightArmSeg4',
-        'LeftPincer': 'leftPincer',
-        'RightPincer': 'rightPincer',
-        'LeftMandible': 'leftMandible',
-        'RightMandible': 'rightMandible',
-        'LeftManPart2': 'leftManPart2',
-        'RightManPart2': 'rightManPart2',
-        'Lefteye': 'leftEye',
-        'Righteye': 'rightEye',
-        'Head': 'head',
-        'Seg1': 'seg1',
-        'Seg2': 'seg2',
-        'Seg3': 'seg3',
-        'Seg4': 'seg4',
-        'Seg5': 'seg5',
-        'Seg6': 'seg6',
-        'Seg7': 'seg7',
-        'Seg8': 'seg8',
-        'Tailseg1': 'tailseg1',
-        'Tailseg2': 'tailseg2',
-        'Tailseg3': 'tailseg3',
-        'Tailseg4': 'tailseg4',
-        'Tailseg5': 'tailseg5',
-        'Tailseg6': 'tailseg6',
-        'Tailseg7': 'tailseg7',
-        'Tailseg8': 'tailseg8',
-        'Stinger1': 'stinger1',
-        'Stinger2': 'stinger2',
-        'Stinger3': 'stinger3',
-        'Leg1Seg1': 'leg1Seg1',
-        'Leg1Seg2': 'leg1Seg2',
-        'Leg1Seg3': 'leg1Seg3',
-        'Leg1Seg4': 'leg1Seg4',
-        'Leg1Seg5': 'leg1Seg5',
-        'Leg2Seg1': 'leg2Seg1',
-        'Leg2Seg2': 'leg2Seg2',
-        'Leg2Seg3': 'leg2Seg3',
-        'Leg2Seg4': 'leg2Seg4',
-        'Leg2Seg5': 'leg2Seg5',
-        'Leg3Seg1': 'leg3Seg1',
-        'Leg3Seg2': 'leg3Seg2',
-        'Leg3Seg3': 'leg3Seg3',
-        'Leg3Seg4': 'leg3Seg4',
-        'Leg3Seg5': 'leg3Seg5',
-        'Leg4Seg1': 'leg4Seg1',
-        'Leg4Seg2': 'leg4Seg2',
-        'Leg4Seg3': 'leg4Seg3',
-        'Leg4Seg4': 'leg4Seg4',
-        'Leg4Seg5': 'leg4Seg5',
-        'Leg5Seg1': 'leg5Seg1',
-        'Leg5Seg2': 'leg5Seg2',
-        'Leg5Seg3': 'leg5Seg3',
-        'Leg5Seg4': 'leg5Seg4',
-        'Leg5Seg5': 'leg5Seg5',
-        'Leg6Seg1': 'leg6Seg1',
-        'Leg6Seg2': 'leg6Seg2',
-        'Leg6Seg3': 'leg6Seg3',
-        'Leg6Seg4': 'leg6Seg4',
-        'Leg6Seg5': 'leg6Seg5',
-        'Leg7Seg1': 'leg7Seg1',
-        'Leg7Seg2': 'leg7Seg2',
-        'Leg7Seg3': 'leg7Seg3',
-        'Leg7Seg4': 'leg7Seg4',
-        'Leg7Seg5': 'leg7Seg5',
-        'Leg8Seg1': 'leg8Seg1',
-        'Leg8Seg2': 'leg8Seg2',
-        'Leg8Seg3': 'leg8Seg3',
-        'Leg8Seg4': 'leg8Seg4',
-        'Leg8Seg5': 'leg8Seg5',
-        'body': 'head',
-        'Body': 'head',
-        'torso': 'seg1',
-        'Torso': 'seg1',
-        'segment1': 'seg1',
-        'Segment1': 'seg1',
-        'segment2': 'seg2',
-        'Segment2': 'seg2',
-        'segment3': 'seg3',
-        'Segment3': 'seg3',
-        'segment4': 'seg4',
-        'Segment4': 'seg4',
-        'segment5': 'seg5',
-        'Segment5': 'seg5',
-        'segment6': 'seg6',
-        'Segment6': 'seg6',
-        'segment7': 'seg7',
-        'Segment7': 'seg7',
-        'segment8': 'seg8',
-        'Segment8': 'seg8'
-    }
+    return _NAME_MAPPINGS.get(old_name, old_name)
+
+
+def json_response(payload: Dict, status: int = 200):
+    response = None
+    if orjson is not None:
+        try:
+            response = Response(orjson.dumps(payload), status=status, mimetype='application/json')
+        except orjson.JSONEncodeError:
+            pass
+
+    if response is None:
+        response = jsonify(payload)
+        response.status_code = status
+
+    body = response.get_data()
+    if len(body) > GZIP_MIN_BYTES and request.accept_encodings.quality('gzip'):
+        response.set_data(gzip.compress(body, compresslevel=1))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
 
-    return name_mappings.get(old_name, old_name)
+    return response
+
+
+@full_convert_bp.before_request
+def limit_request_size():
+    app_limit = current_app.config['MAX_CONTENT_LENGTH']
+    if app_limit is None or app_limit > MAX_REQUEST_BYTES:
+        request.max_content_length = MAX_REQUEST_BYTES
+
+    form_limit = request.max_form_memory_size
+    if form_limit is not None and form_limit < MAX_REQUEST_BYTES:
+        request.max_form_memory_size = MAX_REQUEST_BYTES
+
+
+@full_convert_bp.errorhandler(RequestEntityTooLarge)
+def request_too_large(e):
+    limit = request.max_content_length
+    if limit is not None and request.content_length is not None and request.content_length <= limit:
+        return json_response({'error': 'Formulário excede o número de partes aceito'}, 413)
+
+    limit_text = f'{limit // 1024} KB' if limit >= 1024 else f'{limit} bytes'
+    return json_response({'error': f'Requisição excede o limite de {limit_text}'}, 413)
+
+
+def render_index_page() -> str:
+    pages = current_app.extensions.setdefault('full_convert_index_pages', {})
+    page = pages.get(request.script_root)
+    if page is None:
+        if len(pages) >= _INDEX_PAGE_CACHE_SIZE:
+            pages.clear()
+        page = pages[request.script_root] = render_template('full_converter.html')
+    return page
 
 
 @full_convert_bp.route('/')
 def index():
-    return render_template('full_converter.html')
+    if current_app.debug:
+        return render_template('full_converter.html')
+    return render_index_page()
 
 
 @full_convert_bp.route('/convert', methods=['POST'])
 def convert():
-    try:
-        if request.is_json:
-            data = request.get_json()
-            code_input = data.get('code_input', '').strip()
-        else:
-            code_input = request.form.get('code_input', '').strip()
-
-        if not code_input:
-            return jsonify({'error':
-                           'Código de entrada não pode estar vazio'}), 400
+    if request.mimetype in ('text/plain', 'application/octet-stream'):
+        code_input = request.get_data(cache=False, as_text=True)
+    elif request.is_json:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict) or not isinstance(data.get('code_input', ''), str):
+            return json_response({'error':
+                                  'JSON inválido: envie um objeto com o campo code_input'}, 400)
+        code_input = data.get('code_input', '')
+    else:
+        code_input = request.form.get('code_input', '')
 
-        converted_code = convert_model_code(code_input)
+    code_input = code_input.strip()
+    if not code_input:
+        return json_response({'error':
+                              'Código de entrada não pode estar vazio'}, 400)
 
-        return jsonify({
-            'converted_code': converted_code,
-            'success': True
-        })
+    if len(code_input) > MAX_INPUT_CHARS:
+        return json_response({'error':
+                              f'Código de entrada excede o limite de {MAX_INPUT_CHARS // 1024} K caracteres'}, 413)
 
+    try:
+        converted_code = convert_model_code(code_input)
     except ValueError as e:
-        return jsonify({'error': str(e)}), 400
+        return json_response({'error': str(e)}, 400)
     except Exception as e:
-        return jsonify({'error': f'Erro interno na conversão: {str(e)}'}), 500
\ No newline at end of file
+        current_app.logger.exception('Falha na conversão do modelo')
+        return json_response({'error': f'Erro interno na conversão: {str(e)}'}, 500)
+
+    return json_response({
+        'converted_code': converted_code,
+        'success': True
+    })